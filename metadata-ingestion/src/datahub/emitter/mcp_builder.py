@@ -246,15 +246,23 @@ def add_dataset_to_container(
 def add_entity_to_container(
     container_key: KeyType, entity_type: str, entity_urn: str
 ) -> Iterable[MetadataWorkUnit]:
+    yield from add_entities_to_container(container_key, entity_type, [entity_urn])
+
+
+def add_entities_to_container(
+    container_key: KeyType, entity_type: str, entity_urns: Iterable[str]
+) -> Iterable[MetadataWorkUnit]:
+    # The container aspect lives on each entity, so one workunit is still needed per
+    # entity; only the container urn is shared.
     container_urn = make_container_urn(
         guid=container_key.guid(),
     )
-    mcp = MetadataChangeProposalWrapper(
-        entityType=entity_type,
-        changeType=ChangeTypeClass.UPSERT,
-        entityUrn=entity_urn,
-        aspectName="container",
-        aspect=ContainerClass(container=f"{container_urn}"),
-    )
-    wu = MetadataWorkUnit(id=f"container-{container_urn}-to-{entity_urn}", mcp=mcp)
-    yield wu
+    for entity_urn in entity_urns:
+        mcp = MetadataChangeProposalWrapper(
+            entityType=entity_type,
+            changeType=ChangeTypeClass.UPSERT,
+            entityUrn=entity_urn,
+            aspectName="container",
+            aspect=ContainerClass(container=f"{container_urn}"),
+        )
+        yield MetadataWorkUnit(id=f"container-{container_urn}-to-{entity_urn}", mcp=mcp)
@@ -48,12 +48,16 @@ class PipelineContext:
         pipeline_name: Optional[str] = None,
         dry_run: bool = False,
         preview_mode: bool = False,
+        sink_identity: Optional[str] = None,
     ) -> None:
         self.run_id = run_id
         self.graph = DataHubGraph(datahub_api) if datahub_api is not None else None
         self.pipeline_name = pipeline_name
         self.dry_run_mode = dry_run
         self.preview_mode = preview_mode
+        # Digest identifying where the pipeline writes to, for sources that keep
+        # state about what they have already emitted.
+        self.sink_identity = sink_identity
         self.reporters: Dict[str, Committable] = dict()
         self.checkpointers: Dict[str, Committable] = dict()
 
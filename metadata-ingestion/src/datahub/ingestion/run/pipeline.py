@@ -1,5 +1,7 @@
 import datetime
+import hashlib
 import itertools
+import json
 import logging
 import uuid
 from math import log10
@@ -114,6 +116,7 @@ class Pipeline:
             pipeline_name=self.config.pipeline_name,
             dry_run=dry_run,
             preview_mode=preview_mode,
+            sink_identity=self._get_sink_identity(),
         )
 
         sink_type = self.config.sink.type
@@ -134,6 +137,11 @@ class Pipeline:
         self._configure_transforms()
         self._configure_reporting()
 
+    def _get_sink_identity(self) -> str:
+        # Sink configs carry credentials, so only a digest of them is shared.
+        sink_config = json.dumps(self.config.sink.dict(), sort_keys=True, default=str)
+        return hashlib.blake2b(sink_config.encode("utf-8")).hexdigest()
+
     def _configure_transforms(self) -> None:
         self.transformers = []
         if self.config.transformers is not None:
@@ -1,10 +1,14 @@
+import concurrent.futures
+import hashlib
+import itertools
 import json
 import logging
+import shelve
+from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-import dateutil.parser as dp
 from pydantic import validator
 from tableauserverclient import (
     PersonalAccessTokenAuth,
@@ -18,19 +22,21 @@ from datahub.configuration.common import ConfigModel, ConfigurationError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import (
     PlatformKey,
-    add_entity_to_container,
+    add_entities_to_container,
     gen_containers,
 )
+from datahub.ingestion.api.committable import CommitPolicy, Committable
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.tableau_common import (
-    FIELD_TYPE_MAPPING,
     MetadataQueryException,
     clean_query,
     custom_sql_graphql_query,
-    get_field_value_in_sheet,
+    get_field_values_in_sheet,
+    get_schema_field_data_type,
     get_tags_from_params,
+    get_timestamp_millis,
     get_unique_custom_sql,
     make_description_from_params,
     make_table_urn,
@@ -54,10 +60,8 @@ from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import (
 )
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
-    NullTypeClass,
     OtherSchema,
     SchemaField,
-    SchemaFieldDataType,
     SchemaMetadata,
 )
 from datahub.metadata.schema_classes import (
@@ -78,6 +82,18 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 # Replace / with |
 REPLACE_SLASH_CHAR = "|"
+REPLACE_SLASH_TABLE = str.maketrans({"/": REPLACE_SLASH_CHAR})
+
+
+# Project and workbook names repeat across most entities of an ingestion run.
+@lru_cache(maxsize=8192)
+def _sanitize_name(name: str) -> str:
+    return name.translate(REPLACE_SLASH_TABLE)
+
+
+# Page size used for queries filtered by a list of ids. Requesting every id in a
+# single page can exceed the node limit of the Tableau metadata API.
+PAGE_SIZE = 100
 
 
 class TableauConfig(ConfigModel):
@@ -94,7 +110,9 @@ class TableauConfig(ConfigModel):
     ingest_owner: Optional[bool] = False
 
     workbooks_page_size: int = 10
+    max_threads: int = 8
     env: str = builder.DEFAULT_ENV
+    cache_path: Optional[str] = None
 
     @validator("connect_uri")
     def remove_trailing_slash(cls, v):
@@ -105,12 +123,55 @@ class WorkbookKey(PlatformKey):
     workbook_id: str
 
 
+@dataclass
+class TableauSourceReport(SourceReport):
+    workunits_skipped_unchanged: int = 0
+
+
+class TableauEmittedCache(Committable):
+    """
+    Digests of the workunits emitted by the last successful run against a target.
+    Digests of the current run are only written back once the pipeline commits.
+    """
+
+    def __init__(self, path: str, target: str):
+        # Tableau MCPs treat sink errors as warnings, so a run with warnings may have
+        # had writes rejected and must not be committed.
+        super().__init__(
+            name="tableau-emitted-cache",
+            commit_policy=CommitPolicy.ON_NO_ERRORS_AND_NO_WARNINGS,
+        )
+        self.path = path
+        self.target = hashlib.blake2b(target.encode("utf-8")).hexdigest()
+        with shelve.open(self.path) as shelf:
+            self.previous_digests: Dict[str, List[str]] = shelf.get(self.target, {})
+        self.current_digests: Dict[str, List[str]] = {}
+
+    def is_unchanged(self, wu: MetadataWorkUnit) -> bool:
+        payload = json.dumps(wu.metadata.to_obj(), sort_keys=True)
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        digests = self.current_digests.setdefault(wu.id, [])
+        digests.append(digest)
+        # Some ids are produced several times per run with different payloads, e.g.
+        # an upstream table used by several workbooks, and the last one emitted is
+        # what the sink keeps. Only skip an id that the last run produced exactly
+        # once with the same payload; any further occurrence in this run has no
+        # previous digest and is emitted, so the sink still ends on the last one.
+        return len(digests) == 1 and self.previous_digests.get(wu.id) == [digest]
+
+    def commit(self) -> None:
+        # Workunits not produced by this run are dropped so that they are emitted
+        # again the next time they show up.
+        with shelve.open(self.path) as shelf:
+            shelf[self.target] = self.current_digests
+        self.committed = True
+
+
 class TableauSource(Source):
     config: TableauConfig
-    report: SourceReport
+    report: TableauSourceReport
     platform = "tableau"
     server: Server
-    upstream_tables: Dict[str, Tuple[Any, str]] = {}
 
     def __hash__(self):
         return id(self)
@@ -119,13 +180,34 @@ class TableauSource(Source):
         super().__init__(ctx)
 
         self.config = config
-        self.report = SourceReport()
-        # This list keeps track of datasource being actively used by workbooks so that we only retrieve those
+        self.report = TableauSourceReport()
+        # This set keeps track of datasource being actively used by workbooks so that we only retrieve those
         # when emitting published data sources.
-        self.datasource_ids_being_used: List[str] = []
-        # This list keeps track of datasource being actively used by workbooks so that we only retrieve those
+        self.datasource_ids_being_used: Set[str] = set()
+        # This set keeps track of datasource being actively used by workbooks so that we only retrieve those
         # when emitting custom SQL data sources.
-        self.custom_sql_ids_being_used: List[str] = []
+        self.custom_sql_ids_being_used: Set[str] = set()
+        # Upstream tables discovered while processing the current workbook. Flushed by
+        # emit_upstream_tables() so that each workbook only emits its own tables.
+        self.upstream_tables: Dict[str, Tuple[Any, str]] = {}
+
+        # Url and path fragments that do not change during an ingestion run.
+        self.platform_urn = f"urn:li:dataPlatform:{self.platform}"
+        self.dataset_browse_path_prefix = f"/{self.config.env.lower()}/{self.platform}"
+        self.site_url_part = f"/site/{self.config.site}" if self.config.site else ""
+        self.views_url_prefix = f"{self.config.connect_uri}/#{self.site_url_part}/views"
+        self.site_authoring_url_part = (
+            f"/t/{self.config.site}" if self.config.site else ""
+        )
+        # Fallback for sheets and dashboards without createdAt/updatedAt.
+        self.run_started_at = datetime.now()
+
+        self.emitted_cache: Optional[TableauEmittedCache] = None
+        if self.config.cache_path and not ctx.dry_run_mode:
+            # The same cache file can serve several Tableau sites and sinks.
+            target = f"{self.config.connect_uri}|{self.config.site}|{ctx.sink_identity}"
+            self.emitted_cache = TableauEmittedCache(self.config.cache_path, target)
+            ctx.register_checkpointer(self.emitted_cache)
 
         self._authenticate()
 
@@ -170,9 +252,16 @@ class TableauSource(Source):
         query_filter: str,
         count: int = 0,
         current_count: int = 0,
-    ) -> Tuple[dict, int, int]:
+        end_cursor: Optional[str] = None,
+    ) -> Tuple[dict, int, bool, Optional[str]]:
         query_data = query_metadata(
-            self.server, query, connection_type, count, current_count, query_filter
+            self.server,
+            query,
+            connection_type,
+            count,
+            current_count,
+            query_filter,
+            end_cursor,
         )
 
         if "errors" in query_data:
@@ -183,8 +272,73 @@ class TableauSource(Source):
 
         connection_object = query_data.get("data", {}).get(connection_type, {})
         total_count = connection_object.get("totalCount", 0)
-        has_next_page = connection_object.get("pageInfo", {}).get("hasNextPage", False)
-        return connection_object, total_count, has_next_page
+        page_info = connection_object.get("pageInfo", {})
+        has_next_page = page_info.get("hasNextPage", False)
+        end_cursor = page_info.get("endCursor")
+        return connection_object, total_count, has_next_page, end_cursor
+
+    def get_connection_nodes(
+        self, query: str, connection_type: str, query_filter: str, page_size: int
+    ) -> Iterable[dict]:
+        """
+        Page through a connection and yield its nodes one at a time, so that a page
+        is released as soon as its nodes have been consumed.
+        """
+        _, total_count, has_next_page, end_cursor = self.get_connection_object(
+            query, connection_type, query_filter
+        )
+        if not has_next_page:
+            return
+
+        if self.config.max_threads <= 1:
+            # Serial paging follows the end cursor of each page; the concurrent path
+            # below has to address pages by offset instead.
+            current_count = 0
+            while has_next_page:
+                count = (
+                    page_size
+                    if current_count + page_size < total_count
+                    else total_count - current_count
+                )
+                (
+                    connection_object,
+                    total_count,
+                    has_next_page,
+                    end_cursor,
+                ) = self.get_connection_object(
+                    query,
+                    connection_type,
+                    query_filter,
+                    count,
+                    current_count,
+                    end_cursor,
+                )
+                current_count += count
+                yield from connection_object.get("nodes", [])
+            return
+
+        # The total count is known up front, so the remaining pages can be fetched
+        # concurrently by offset. Pages are requested max_threads at a time and
+        # yielded in order, which keeps the number of buffered pages bounded.
+        offsets = list(range(0, total_count, page_size))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_threads
+        ) as async_executor:
+            for i in range(0, len(offsets), self.config.max_threads):
+                page_futures = [
+                    async_executor.submit(
+                        self.get_connection_object,
+                        query,
+                        connection_type,
+                        query_filter,
+                        min(page_size, total_count - offset),
+                        offset,
+                    )
+                    for offset in offsets[i : i + self.config.max_threads]
+                ]
+                for page_future in page_futures:
+                    connection_object, _, _, _ = page_future.result()
+                    yield from connection_object.get("nodes", [])
 
     def emit_workbooks(self, workbooks_page_size: int) -> Iterable[MetadataWorkUnit]:
 
@@ -194,37 +348,15 @@ class TableauSource(Source):
             else ""
         )
 
-        workbook_connection, total_count, has_next_page = self.get_connection_object(
-            workbook_graphql_query, "workbooksConnection", projects
-        )
-
-        current_count = 0
-        while has_next_page:
-            count = (
-                workbooks_page_size
-                if current_count + workbooks_page_size < total_count
-                else total_count - current_count
-            )
-            (
-                workbook_connection,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object(
-                workbook_graphql_query,
-                "workbooksConnection",
-                projects,
-                count,
-                current_count,
-            )
-
-            current_count += count
-
-            for workbook in workbook_connection.get("nodes", []):
-                yield from self.emit_workbook_as_container(workbook)
-                yield from self.emit_sheets_as_charts(workbook)
-                yield from self.emit_dashboards(workbook)
-                yield from self.emit_embedded_datasource(workbook)
-                yield from self.emit_upstream_tables()
+        for workbook in self.get_connection_nodes(
+            workbook_graphql_query, "workbooksConnection", projects, workbooks_page_size
+        ):
+            workbook_key = self.gen_workbook_key(workbook)
+            yield from self.emit_workbook_as_container(workbook, workbook_key)
+            yield from self.emit_sheets_as_charts(workbook, workbook_key)
+            yield from self.emit_dashboards(workbook, workbook_key)
+            yield from self.emit_embedded_datasource(workbook, workbook_key)
+            yield from self.emit_upstream_tables()
 
     def _track_custom_sql_ids(self, field: dict) -> None:
         # Tableau shows custom sql datasource as a table in ColumnField.
@@ -232,11 +364,8 @@ class TableauSource(Source):
             for column in field.get("columns", []):
                 table_id = column.get("table", {}).get("id")
 
-                if (
-                    table_id is not None
-                    and table_id not in self.custom_sql_ids_being_used
-                ):
-                    self.custom_sql_ids_being_used.append(table_id)
+                if table_id is not None:
+                    self.custom_sql_ids_being_used.add(table_id)
 
     def _create_upstream_table_lineage(
         self, datasource: dict, project: str, is_custom_sql: bool = False
@@ -244,20 +373,23 @@ class TableauSource(Source):
         upstream_tables = []
         upstream_dbs = datasource.get("upstreamDatabases", [])
         upstream_db = upstream_dbs[0].get("name", "") if upstream_dbs else ""
+        path_prefix = f"{_sanitize_name(project)}/{datasource.get('name', '')}"
 
         for table in datasource.get("upstreamTables", []):
+            columns = table.get("columns", [])
             # skip upstream tables when there is no column info when retrieving embedded datasource
             # Schema details for these will be taken care in self.emit_custom_sql_ds()
-            if not is_custom_sql and not table.get("columns"):
+            if not is_custom_sql and not columns:
                 continue
 
+            table_name = table.get("name", "")
             schema = self._get_schema(table.get("schema", ""), upstream_db)
             table_urn = make_table_urn(
                 self.config.env,
                 upstream_db,
                 table.get("connectionType", ""),
                 schema,
-                table.get("name", ""),
+                table_name,
             )
 
             upstream_table = UpstreamClass(
@@ -265,117 +397,94 @@ class TableauSource(Source):
                 type=DatasetLineageTypeClass.TRANSFORMED,
             )
             upstream_tables.append(upstream_table)
-            table_path = f"{project.replace('/', REPLACE_SLASH_CHAR)}/{datasource.get('name', '')}/{table.get('name', '')}"
-            self.upstream_tables[table_urn] = (
-                table.get("columns", []),
-                table_path,
-            )
+            self.upstream_tables[table_urn] = (columns, f"{path_prefix}/{table_name}")
         return upstream_tables
 
     def emit_custom_sql_datasources(self) -> Iterable[MetadataWorkUnit]:
-        count_on_query = len(self.custom_sql_ids_being_used)
+        if not self.custom_sql_ids_being_used:
+            return
+
         custom_sql_filter = "idWithin: {}".format(
-            json.dumps(self.custom_sql_ids_being_used)
-        )
-        custom_sql_connection, total_count, has_next_page = self.get_connection_object(
-            custom_sql_graphql_query, "customSQLTablesConnection", custom_sql_filter
+            json.dumps(list(self.custom_sql_ids_being_used))
         )
-
-        current_count = 0
-        while has_next_page:
-            count = (
-                count_on_query
-                if current_count + count_on_query < total_count
-                else total_count - current_count
-            )
-            (
-                custom_sql_connection,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object(
+        unique_custom_sql = get_unique_custom_sql(
+            self.get_connection_nodes(
                 custom_sql_graphql_query,
                 "customSQLTablesConnection",
                 custom_sql_filter,
-                count,
-                current_count,
+                PAGE_SIZE,
             )
-            current_count += count
-
-            unique_custom_sql = get_unique_custom_sql(
-                custom_sql_connection.get("nodes", [])
+        )
+        for csql in unique_custom_sql:
+            csql_id: str = csql.get("id", "")
+            csql_urn = builder.make_dataset_urn(self.platform, csql_id, self.config.env)
+            dataset_snapshot = DatasetSnapshot(
+                urn=csql_urn,
+                aspects=[],
             )
-            for csql in unique_custom_sql:
-                csql_id: str = csql.get("id", "")
-                csql_urn = builder.make_dataset_urn(
-                    self.platform, csql_id, self.config.env
-                )
-                dataset_snapshot = DatasetSnapshot(
-                    urn=csql_urn,
-                    aspects=[],
-                )
 
-                # lineage from datasource -> custom sql source #
-                yield from self._create_lineage_from_csql_datasource(
-                    csql_urn, csql.get("datasources", [])
-                )
+            # lineage from datasource -> custom sql source #
+            yield from self._create_lineage_from_csql_datasource(
+                csql_urn, csql.get("datasources", [])
+            )
 
-                # lineage from custom sql -> datasets/tables #
-                columns = csql.get("columns", [])
-                yield from self._create_lineage_to_upstream_tables(csql_urn, columns)
+            # lineage from custom sql -> datasets/tables #
+            columns = csql.get("columns", [])
+            yield from self._create_lineage_to_upstream_tables(csql_urn, columns)
 
-                #  Schema Metadata
-                schema_metadata = self.get_schema_metadata_for_custom_sql(columns)
-                if schema_metadata is not None:
-                    dataset_snapshot.aspects.append(schema_metadata)
+            #  Schema Metadata
+            schema_metadata = self.get_schema_metadata_for_custom_sql(columns)
+            if schema_metadata is not None:
+                dataset_snapshot.aspects.append(schema_metadata)
 
-                # Browse path
-                browse_paths = BrowsePathsClass(
-                    paths=[
-                        f"/{self.config.env.lower()}/{self.platform}/Custom SQL/{csql.get('name', '')}/{csql_id}"
-                    ]
-                )
-                dataset_snapshot.aspects.append(browse_paths)
+            # Browse path
+            browse_paths = BrowsePathsClass(
+                paths=[
+                    f"{self.dataset_browse_path_prefix}/Custom SQL/{csql.get('name', '')}/{csql_id}"
+                ]
+            )
+            dataset_snapshot.aspects.append(browse_paths)
 
-                dataset_properties = DatasetPropertiesClass(
-                    name=csql.get("name"), description=csql.get("description")
-                )
+            dataset_properties = DatasetPropertiesClass(
+                name=csql.get("name"), description=csql.get("description")
+            )
 
-                dataset_snapshot.aspects.append(dataset_properties)
+            dataset_snapshot.aspects.append(dataset_properties)
 
-                view_properties = ViewPropertiesClass(
-                    materialized=False,
-                    viewLanguage="SQL",
-                    viewLogic=clean_query(csql.get("query", "")),
-                )
-                dataset_snapshot.aspects.append(view_properties)
+            view_properties = ViewPropertiesClass(
+                materialized=False,
+                viewLanguage="SQL",
+                viewLogic=clean_query(csql.get("query", "")),
+            )
+            dataset_snapshot.aspects.append(view_properties)
 
-                yield self.get_metadata_change_event(dataset_snapshot)
-                yield self.get_metadata_change_proposal(
-                    dataset_snapshot.urn,
-                    aspect_name="subTypes",
-                    aspect=SubTypesClass(typeNames=["View", "Custom SQL"]),
-                )
+            yield self.get_metadata_change_event(dataset_snapshot)
+            yield self.get_metadata_change_proposal(
+                dataset_snapshot.urn,
+                aspect_name="subTypes",
+                aspect=SubTypesClass(typeNames=["View", "Custom SQL"]),
+            )
 
     def get_schema_metadata_for_custom_sql(
         self, columns: List[dict]
     ) -> Optional[SchemaMetadata]:
+        fields = []
         schema_metadata = None
         for field in columns:
             # Datasource fields
-            fields = []
             nativeDataType = field.get("remoteType", "UNKNOWN")
-            TypeClass = FIELD_TYPE_MAPPING.get(nativeDataType, NullTypeClass)
             schema_field = SchemaField(
                 fieldPath=field.get("name", ""),
-                type=SchemaFieldDataType(type=TypeClass()),
+                type=get_schema_field_data_type(nativeDataType),
                 nativeDataType=nativeDataType,
                 description=field.get("description", ""),
             )
             fields.append(schema_field)
 
+        if fields:
             schema_metadata = SchemaMetadata(
                 schemaName="test",
-                platform=f"urn:li:dataPlatform:{self.platform}",
+                platform=self.platform_urn,
                 version=0,
                 fields=fields,
                 hash="",
@@ -387,9 +496,7 @@ class TableauSource(Source):
         self, csql_urn: str, csql_datasource: List[dict]
     ) -> Iterable[MetadataWorkUnit]:
         for datasource in csql_datasource:
-            datasource_urn = builder.make_dataset_urn(
-                self.platform, datasource.get("id", ""), self.config.env
-            )
+            datasource_urn = self._get_datasource_urn(datasource)
             upstream_csql = UpstreamClass(
                 dataset=csql_urn,
                 type=DatasetLineageTypeClass.TRANSFORMED,
@@ -403,31 +510,27 @@ class TableauSource(Source):
     def _create_lineage_to_upstream_tables(
         self, csql_urn: str, columns: List[dict]
     ) -> Iterable[MetadataWorkUnit]:
-        used_datasources = []
-        # Get data sources from columns' reference fields.
+        # Get unique data sources from columns' reference fields.
+        datasources_by_id: Dict[str, dict] = {}
         for field in columns:
-            data_sources = [
-                reference.get("datasource")
-                for reference in field.get("referencedByFields", {})
-                if reference.get("datasource") is not None
-            ]
+            for reference in field.get("referencedByFields", ()):
+                datasource = reference.get("datasource")
+                if datasource is not None:
+                    datasources_by_id.setdefault(datasource.get("id", ""), datasource)
 
-            for datasource in data_sources:
-                if datasource.get("id", "") in used_datasources:
-                    continue
-                used_datasources.append(datasource.get("id", ""))
-                upstream_tables = self._create_upstream_table_lineage(
-                    datasource,
-                    datasource.get("workbook", {}).get("projectName", ""),
-                    True,
+        for datasource in datasources_by_id.values():
+            upstream_tables = self._create_upstream_table_lineage(
+                datasource,
+                datasource.get("workbook", {}).get("projectName", ""),
+                True,
+            )
+            if upstream_tables:
+                upstream_lineage = UpstreamLineage(upstreams=upstream_tables)
+                yield self.get_metadata_change_proposal(
+                    csql_urn,
+                    aspect_name="upstreamLineage",
+                    aspect=upstream_lineage,
                 )
-                if upstream_tables:
-                    upstream_lineage = UpstreamLineage(upstreams=upstream_tables)
-                    yield self.get_metadata_change_proposal(
-                        csql_urn,
-                        aspect_name="upstreamLineage",
-                        aspect=upstream_lineage,
-                    )
 
     def _get_schema_metadata_for_embedded_datasource(
         self, datasource_fields: List[dict]
@@ -439,11 +542,10 @@ class TableauSource(Source):
             self._track_custom_sql_ids(field)
 
             nativeDataType = field.get("dataType", "UNKNOWN")
-            TypeClass = FIELD_TYPE_MAPPING.get(nativeDataType, NullTypeClass)
 
             schema_field = SchemaField(
                 fieldPath=field["name"],
-                type=SchemaFieldDataType(type=TypeClass()),
+                type=get_schema_field_data_type(nativeDataType),
                 description=make_description_from_params(
                     field.get("description", ""), field.get("formula")
                 ),
@@ -463,7 +565,7 @@ class TableauSource(Source):
         if fields:
             schema_metadata = SchemaMetadata(
                 schemaName="test",
-                platform=f"urn:li:dataPlatform:{self.platform}",
+                platform=self.platform_urn,
                 version=0,
                 fields=fields,
                 hash="",
@@ -476,9 +578,7 @@ class TableauSource(Source):
         self, snap_shot: Union["DatasetSnapshot", "DashboardSnapshot", "ChartSnapshot"]
     ) -> MetadataWorkUnit:
         mce = MetadataChangeEvent(proposedSnapshot=snap_shot)
-        work_unit = MetadataWorkUnit(id=snap_shot.urn, mce=mce)
-        self.report.report_workunit(work_unit)
-        return work_unit
+        return MetadataWorkUnit(id=snap_shot.urn, mce=mce)
 
     def get_metadata_change_proposal(
         self,
@@ -493,13 +593,16 @@ class TableauSource(Source):
             aspectName=aspect_name,
             aspect=aspect,
         )
-        mcp_workunit = MetadataWorkUnit(
-            id=f"tableau-{mcp.entityUrn}-{mcp.aspectName}",
+        return MetadataWorkUnit(
+            id=f"tableau-{urn}-{aspect_name}",
             mcp=mcp,
             treat_errors_as_warnings=True,
         )
-        self.report.report_workunit(mcp_workunit)
-        return mcp_workunit
+
+    def _get_datasource_urn(self, datasource: dict) -> str:
+        return builder.make_dataset_urn(
+            self.platform, datasource.get("id", ""), self.config.env
+        )
 
     def emit_datasource(
         self, datasource: dict, workbook: dict = None
@@ -509,17 +612,14 @@ class TableauSource(Source):
             datasource_info = datasource
 
         project = (
-            datasource_info.get("projectName", "").replace("/", REPLACE_SLASH_CHAR)
+            _sanitize_name(datasource_info.get("projectName", ""))
             if datasource_info
             else ""
         )
         datasource_id = datasource.get("id", "")
         datasource_name = f"{datasource.get('name')}.{datasource_id}"
-        datasource_urn = builder.make_dataset_urn(
-            self.platform, datasource_id, self.config.env
-        )
-        if datasource_id not in self.datasource_ids_being_used:
-            self.datasource_ids_being_used.append(datasource_id)
+        datasource_urn = self._get_datasource_urn(datasource)
+        self.datasource_ids_being_used.add(datasource_id)
 
         dataset_snapshot = DatasetSnapshot(
             urn=datasource_urn,
@@ -529,7 +629,7 @@ class TableauSource(Source):
         # Browse path
         browse_paths = BrowsePathsClass(
             paths=[
-                f"/{self.config.env.lower()}/{self.platform}/{project}/{datasource.get('name', '')}/{datasource_name}"
+                f"{self.dataset_browse_path_prefix}/{project}/{datasource.get('name', '')}/{datasource_name}"
             ]
         )
         dataset_snapshot.aspects.append(browse_paths)
@@ -589,48 +689,20 @@ class TableauSource(Source):
             aspect=SubTypesClass(typeNames=["Data Source"]),
         )
 
-        if datasource.get("__typename") == "EmbeddedDatasource":
-            yield from add_entity_to_container(
-                self.gen_workbook_key(workbook), "dataset", dataset_snapshot.urn
-            )
-
     def emit_published_datasources(self) -> Iterable[MetadataWorkUnit]:
-        count_on_query = len(self.datasource_ids_being_used)
+        if not self.datasource_ids_being_used:
+            return
+
         datasource_filter = "idWithin: {}".format(
-            json.dumps(self.datasource_ids_being_used)
+            json.dumps(list(self.datasource_ids_being_used))
         )
-        (
-            published_datasource_conn,
-            total_count,
-            has_next_page,
-        ) = self.get_connection_object(
+        for datasource in self.get_connection_nodes(
             published_datasource_graphql_query,
             "publishedDatasourcesConnection",
             datasource_filter,
-        )
-
-        current_count = 0
-        while has_next_page:
-            count = (
-                count_on_query
-                if current_count + count_on_query < total_count
-                else total_count - current_count
-            )
-            (
-                published_datasource_conn,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object(
-                published_datasource_graphql_query,
-                "publishedDatasourcesConnection",
-                datasource_filter,
-                count,
-                current_count,
-            )
-
-            current_count += count
-            for datasource in published_datasource_conn.get("nodes", []):
-                yield from self.emit_datasource(datasource)
+            PAGE_SIZE,
+        ):
+            yield from self.emit_datasource(datasource)
 
     def emit_upstream_tables(self) -> Iterable[MetadataWorkUnit]:
         for (table_urn, (columns, path)) in self.upstream_tables.items():
@@ -640,18 +712,17 @@ class TableauSource(Source):
             )
             # Browse path
             browse_paths = BrowsePathsClass(
-                paths=[f"/{self.config.env.lower()}/{self.platform}/{path}"]
+                paths=[f"{self.dataset_browse_path_prefix}/{path}"]
             )
             dataset_snapshot.aspects.append(browse_paths)
 
             fields = []
             for field in columns:
                 nativeDataType = field.get("remoteType", "UNKNOWN")
-                TypeClass = FIELD_TYPE_MAPPING.get(nativeDataType, NullTypeClass)
 
                 schema_field = SchemaField(
                     fieldPath=field["name"],
-                    type=SchemaFieldDataType(type=TypeClass()),
+                    type=get_schema_field_data_type(nativeDataType),
                     description="",
                     nativeDataType=nativeDataType,
                 )
@@ -660,7 +731,7 @@ class TableauSource(Source):
 
             schema_metadata = SchemaMetadata(
                 schemaName="test",
-                platform=f"urn:li:dataPlatform:{self.platform}",
+                platform=self.platform_urn,
                 version=0,
                 fields=fields,
                 hash="",
@@ -671,7 +742,12 @@ class TableauSource(Source):
 
             yield self.get_metadata_change_event(dataset_snapshot)
 
-    def emit_sheets_as_charts(self, workbook: Dict) -> Iterable[MetadataWorkUnit]:
+        self.upstream_tables.clear()
+
+    def emit_sheets_as_charts(
+        self, workbook: Dict, workbook_key: WorkbookKey
+    ) -> Iterable[MetadataWorkUnit]:
+        chart_urns = []
         for sheet in workbook.get("sheets", []):
             chart_snapshot = ChartSnapshot(
                 urn=builder.make_chart_urn(self.platform, sheet.get("id")),
@@ -679,30 +755,26 @@ class TableauSource(Source):
             )
 
             creator = workbook.get("owner", {}).get("username", "")
-            created_at = sheet.get("createdAt", datetime.now())
-            updated_at = sheet.get("updatedAt", datetime.now())
+            created_at = sheet.get("createdAt", self.run_started_at)
+            updated_at = sheet.get("updatedAt", self.run_started_at)
             last_modified = self.get_last_modified(creator, created_at, updated_at)
 
             if sheet.get("path"):
-                site_part = f"/site/{self.config.site}" if self.config.site else ""
-                sheet_external_url = (
-                    f"{self.config.connect_uri}/#{site_part}/views/{sheet.get('path')}"
-                )
+                sheet_external_url = f"{self.views_url_prefix}/{sheet.get('path')}"
             elif sheet.get("containedInDashboards"):
                 # sheet contained in dashboard
-                site_part = f"/t/{self.config.site}" if self.config.site else ""
                 dashboard_path = sheet.get("containedInDashboards")[0].get("path", "")
-                sheet_external_url = f"{self.config.connect_uri}{site_part}/authoring/{dashboard_path}/{sheet.get('name', '')}"
+                sheet_external_url = f"{self.config.connect_uri}{self.site_authoring_url_part}/authoring/{dashboard_path}/{sheet.get('name', '')}"
             else:
                 # hidden or viz-in-tooltip sheet
                 sheet_external_url = None
-            fields = {}
-            for field in sheet.get("datasourceFields", ""):
-                description = make_description_from_params(
-                    get_field_value_in_sheet(field, "description"),
-                    get_field_value_in_sheet(field, "formula"),
+            fields = {
+                name: make_description_from_params(description, formula)
+                for name, description, formula in (
+                    get_field_values_in_sheet(field, "name", "description", "formula")
+                    for field in sheet.get("datasourceFields") or ()
                 )
-                fields[get_field_value_in_sheet(field, "name")] = description
+            }
 
             # datasource urn
             datasource_urn = []
@@ -713,8 +785,7 @@ class TableauSource(Source):
                     continue
                 ds_urn = builder.make_dataset_urn(self.platform, ds_id, self.config.env)
                 datasource_urn.append(ds_urn)
-                if ds_id not in self.datasource_ids_being_used:
-                    self.datasource_ids_being_used.append(ds_id)
+                self.datasource_ids_being_used.add(ds_id)
 
             # Chart Info
             chart_info = ChartInfoClass(
@@ -730,9 +801,9 @@ class TableauSource(Source):
             # Browse path
             browse_path = BrowsePathsClass(
                 paths=[
-                    f"/{self.platform}/{workbook.get('projectName', '').replace('/', REPLACE_SLASH_CHAR)}"
+                    f"/{self.platform}/{_sanitize_name(workbook.get('projectName', ''))}"
                     f"/{workbook.get('name', '')}"
-                    f"/{sheet.get('name', '').replace('/', REPLACE_SLASH_CHAR)}"
+                    f"/{sheet.get('name', '').translate(REPLACE_SLASH_TABLE)}"
                 ]
             )
             chart_snapshot.aspects.append(browse_path)
@@ -753,31 +824,27 @@ class TableauSource(Source):
                 )
 
             yield self.get_metadata_change_event(chart_snapshot)
+            chart_urns.append(chart_snapshot.urn)
 
-            yield from add_entity_to_container(
-                self.gen_workbook_key(workbook), "chart", chart_snapshot.urn
-            )
+        yield from add_entities_to_container(workbook_key, "chart", chart_urns)
 
-    def emit_workbook_as_container(self, workbook: Dict) -> Iterable[MetadataWorkUnit]:
+    def emit_workbook_as_container(
+        self, workbook: Dict, workbook_key: WorkbookKey
+    ) -> Iterable[MetadataWorkUnit]:
 
-        workbook_container_key = self.gen_workbook_key(workbook)
         creator = workbook.get("owner", {}).get("username")
 
         owner_urn = (
-            builder.make_user_urn(creator)
+            self._get_user_urn(creator)
             if (creator and self.config.ingest_owner)
             else None
         )
 
-        site_part = f"/site/{self.config.site}" if self.config.site else ""
-        workbook_uri = workbook.get("uri", "")
-        workbook_part = (
-            workbook_uri[workbook_uri.index("/workbooks/") :]
-            if workbook.get("uri")
-            else None
-        )
+        workbook_uri = workbook.get("uri") or ""
+        _, sep, workbook_path = workbook_uri.partition("/workbooks/")
+        workbook_part = f"/workbooks/{workbook_path}" if sep else None
         workbook_external_url = (
-            f"{self.config.connect_uri}/#{site_part}{workbook_part}"
+            f"{self.config.connect_uri}/#{self.site_url_part}{workbook_part}"
             if workbook_part
             else None
         )
@@ -789,8 +856,8 @@ class TableauSource(Source):
             else None
         )
 
-        container_workunits = gen_containers(
-            container_key=workbook_container_key,
+        yield from gen_containers(
+            container_key=workbook_key,
             name=workbook.get("name", ""),
             sub_types=["Workbook"],
             description=workbook.get("description"),
@@ -799,33 +866,33 @@ class TableauSource(Source):
             tags=tag_list_str,
         )
 
-        for wu in container_workunits:
-            self.report.report_workunit(wu)
-            yield wu
-
-    def gen_workbook_key(self, workbook):
+    def gen_workbook_key(self, workbook: Dict) -> WorkbookKey:
         return WorkbookKey(
             platform=self.platform, instance=None, workbook_id=workbook["id"]
         )
 
-    def emit_dashboards(self, workbook: Dict) -> Iterable[MetadataWorkUnit]:
-        for dashboard in workbook.get("dashboards", []):
-            dashboard_snapshot = DashboardSnapshot(
-                urn=builder.make_dashboard_urn(self.platform, dashboard.get("id", "")),
-                aspects=[],
-            )
+    def emit_dashboards(
+        self, workbook: Dict, workbook_key: WorkbookKey
+    ) -> Iterable[MetadataWorkUnit]:
+        creator = workbook.get("owner", {}).get("username", "")
+        owner = self._get_ownership(creator)
+        project_part = _sanitize_name(workbook.get("projectName", ""))
+        workbook_part = _sanitize_name(workbook.get("name", ""))
+        browse_path_prefix = f"/{self.platform}/{project_part}/{workbook_part}"
 
-            creator = workbook.get("owner", {}).get("username", "")
-            created_at = dashboard.get("createdAt", datetime.now())
-            updated_at = dashboard.get("updatedAt", datetime.now())
+        dashboard_urns = []
+        for dashboard in workbook.get("dashboards", []):
+            created_at = dashboard.get("createdAt", self.run_started_at)
+            updated_at = dashboard.get("updatedAt", self.run_started_at)
             last_modified = self.get_last_modified(creator, created_at, updated_at)
 
-            site_part = f"/site/{self.config.site}" if self.config.site else ""
-            dashboard_external_url = f"{self.config.connect_uri}/#{site_part}/views/{dashboard.get('path', '')}"
-            title = dashboard.get("name", "").replace("/", REPLACE_SLASH_CHAR) or ""
+            dashboard_external_url = (
+                f"{self.views_url_prefix}/{dashboard.get('path', '')}"
+            )
+            title = dashboard.get("name", "").translate(REPLACE_SLASH_TABLE) or ""
             chart_urns = [
-                builder.make_chart_urn(self.platform, sheet.get("id"))
-                for sheet in dashboard.get("sheets", [])
+                builder.make_chart_urn(self.platform, sheet["id"])
+                for sheet in dashboard.get("sheets", ())
             ]
             dashboard_info_class = DashboardInfoClass(
                 description="",
@@ -835,34 +902,35 @@ class TableauSource(Source):
                 dashboardUrl=dashboard_external_url,
                 customProperties={},
             )
-            dashboard_snapshot.aspects.append(dashboard_info_class)
 
             # browse path
-            browse_paths = BrowsePathsClass(
-                paths=[
-                    f"/{self.platform}/{workbook.get('projectName', '').replace('/', REPLACE_SLASH_CHAR)}"
-                    f"/{workbook.get('name', '').replace('/', REPLACE_SLASH_CHAR)}"
-                    f"/{title}"
-                ]
+            browse_paths = BrowsePathsClass(paths=[f"{browse_path_prefix}/{title}"])
+
+            dashboard_snapshot = DashboardSnapshot(
+                urn=builder.make_dashboard_urn(self.platform, dashboard.get("id", "")),
+                aspects=[dashboard_info_class, browse_paths],
             )
-            dashboard_snapshot.aspects.append(browse_paths)
 
             # Ownership
-            owner = self._get_ownership(creator)
             if owner is not None:
                 dashboard_snapshot.aspects.append(owner)
 
             yield self.get_metadata_change_event(dashboard_snapshot)
+            dashboard_urns.append(dashboard_snapshot.urn)
 
-            yield from add_entity_to_container(
-                self.gen_workbook_key(workbook), "dashboard", dashboard_snapshot.urn
-            )
+        yield from add_entities_to_container(workbook_key, "dashboard", dashboard_urns)
 
-    def emit_embedded_datasource(self, workbook: Dict) -> Iterable[MetadataWorkUnit]:
+    def emit_embedded_datasource(
+        self, workbook: Dict, workbook_key: WorkbookKey
+    ) -> Iterable[MetadataWorkUnit]:
+        datasource_urns = []
         for datasource in workbook.get("embeddedDatasources", []):
             yield from self.emit_datasource(datasource, workbook)
+            if datasource.get("__typename") == "EmbeddedDatasource":
+                datasource_urns.append(self._get_datasource_urn(datasource))
+
+        yield from add_entities_to_container(workbook_key, "dataset", datasource_urns)
 
-    @lru_cache(maxsize=None)
     def _get_schema(self, schema_provided: str, database: str) -> str:
         schema = schema_provided
         if not schema_provided and database in self.config.default_schema_map:
@@ -870,25 +938,31 @@ class TableauSource(Source):
 
         return schema
 
-    @lru_cache(maxsize=None)
     def get_last_modified(
-        self, creator: str, created_at: bytes, updated_at: bytes
+        self,
+        creator: str,
+        created_at: Union[str, datetime],
+        updated_at: Union[str, datetime],
     ) -> ChangeAuditStamps:
         last_modified = ChangeAuditStamps()
         if creator:
-            modified_actor = builder.make_user_urn(creator)
-            created_ts = int(dp.parse(created_at).timestamp() * 1000)
-            modified_ts = int(dp.parse(updated_at).timestamp() * 1000)
+            modified_actor = self._get_user_urn(creator)
+            created_ts = get_timestamp_millis(created_at)
+            modified_ts = get_timestamp_millis(updated_at)
             last_modified = ChangeAuditStamps(
                 created=AuditStamp(time=created_ts, actor=modified_actor),
                 lastModified=AuditStamp(time=modified_ts, actor=modified_actor),
             )
         return last_modified
 
-    @lru_cache(maxsize=None)
+    @lru_cache(maxsize=4096)
+    def _get_user_urn(self, user: str) -> str:
+        return builder.make_user_urn(user)
+
+    @lru_cache(maxsize=1024)
     def _get_ownership(self, user: str) -> Optional[OwnershipClass]:
         if self.config.ingest_owner and user:
-            owner_urn = builder.make_user_urn(user)
+            owner_urn = self._get_user_urn(user)
             ownership: OwnershipClass = OwnershipClass(
                 owners=[
                     OwnerClass(
@@ -907,17 +981,24 @@ class TableauSource(Source):
         return cls(ctx, config)
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        cache = self.emitted_cache
         try:
-            yield from self.emit_workbooks(self.config.workbooks_page_size)
-            if self.datasource_ids_being_used:
-                yield from self.emit_published_datasources()
-            if self.custom_sql_ids_being_used:
-                yield from self.emit_custom_sql_datasources()
+            for wu in itertools.chain(
+                self.emit_workbooks(self.config.workbooks_page_size),
+                self.emit_published_datasources(),
+                self.emit_custom_sql_datasources(),
+            ):
+                if cache is not None and cache.is_unchanged(wu):
+                    logger.debug(f"Skipping unchanged workunit {wu.id}")
+                    self.report.workunits_skipped_unchanged += 1
+                    continue
+                self.report.report_workunit(wu)
+                yield wu
         except MetadataQueryException as md_exception:
             self.report.report_failure(
                 key="tableau-metadata",
                 reason=f"Unable to retrieve metadata from tableau. Information: {str(md_exception)}",
             )
 
-    def get_report(self) -> SourceReport:
+    def get_report(self) -> TableauSourceReport:
         return self.report
@@ -1,6 +1,10 @@
 import html
+import math
+from datetime import datetime
 from functools import lru_cache
-from typing import List
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
+
+import dateutil.parser as dp
 
 import datahub.emitter.mce_builder as builder
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
@@ -9,6 +13,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     DateTypeClass,
     NullTypeClass,
     NumberTypeClass,
+    SchemaFieldDataType,
     StringTypeClass,
     TimeTypeClass,
 )
@@ -59,9 +64,6 @@ workbook_graphql_query = """
           id
           name
           description
-          upstreamColumns {
-            name
-          }
           ... on ColumnField {
             dataCategory
             role
@@ -176,13 +178,6 @@ workbook_graphql_query = """
             dataType
           }
         }
-        upstreamDatasources {
-          name
-        }
-        workbook {
-          name
-          projectName
-        }
       }
     }
 """
@@ -241,21 +236,12 @@ published_datasource_graphql_query = """
     extractLastRefreshTime
     extractLastIncrementalUpdateTime
     extractLastUpdateTime
-    downstreamSheets {
-        name
-        id
-        workbook {
-            name
-            projectName
-            }
-        }
     upstreamTables {
         name
         schema
         fullName
         connectionType
         description
-        contact {name}
     }
     fields {
         __typename
@@ -291,7 +277,6 @@ published_datasource_graphql_query = """
             dataType
             }
     }
-    upstreamDatasources {name}
     owner {username}
     description
     uri
@@ -358,6 +343,14 @@ FIELD_TYPE_MAPPING = {
 }
 
 
+@lru_cache(maxsize=64)
+def get_schema_field_data_type(native_data_type: str) -> SchemaFieldDataType:
+    # Only a handful of native types exist, so the returned type wrappers are shared
+    # between schema fields instead of being allocated per column.
+    TypeClass = FIELD_TYPE_MAPPING.get(native_data_type, NullTypeClass)
+    return SchemaFieldDataType(type=TypeClass())
+
+
 def get_tags_from_params(params: List[str] = []) -> GlobalTagsClass:
     tags = [
         TagAssociationClass(tag=builder.make_tag_urn(tag.upper()))
@@ -419,34 +412,66 @@ def make_description_from_params(description, formula):
     return final_description
 
 
-def get_field_value_in_sheet(field, field_name):
+def get_field_values_in_sheet(field: dict, *field_names: str) -> Tuple[Any, ...]:
     if field.get("__typename", "") == "DatasourceField":
-        field = field.get("remoteField") if field.get("remoteField") else {}
+        field = field.get("remoteField") or {}
 
-    field_value = field.get(field_name, "")
-    return field_value
+    return tuple(field.get(field_name, "") for field_name in field_names)
 
 
-def get_unique_custom_sql(custom_sql_list: List[dict]) -> List[dict]:
-    unique_custom_sql = []
+def get_unique_custom_sql(custom_sql_list: Iterable[dict]) -> Iterable[dict]:
+    seen_ids: Set[str] = set()
     for custom_sql in custom_sql_list:
+        csql_id = custom_sql.get("id")
+        if csql_id in seen_ids:
+            continue
+        seen_ids.add(csql_id)
+
         unique_csql = {
-            "id": custom_sql.get("id"),
+            "id": csql_id,
             "name": custom_sql.get("name"),
             "query": custom_sql.get("query"),
             "columns": custom_sql.get("columns"),
             "tables": custom_sql.get("tables"),
         }
-        datasource_for_csql = []
+        datasource_for_csql: Dict[str, dict] = {}
         for column in custom_sql.get("columns", []):
             for field in column.get("referencedByFields", []):
                 datasource = field.get("datasource")
-                if datasource not in datasource_for_csql:
-                    datasource_for_csql.append(datasource)
+                if datasource is not None:
+                    datasource_for_csql.setdefault(datasource.get("id", ""), datasource)
+
+        unique_csql["datasources"] = list(datasource_for_csql.values())
+        yield unique_csql
+
+
+def get_timestamp_millis(timestamp: Union[str, datetime]) -> int:
+    """
+    Convert a Tableau timestamp to epoch milliseconds
+    """
+    if isinstance(timestamp, datetime):
+        return _datetime_to_millis(timestamp)
+    return _parse_timestamp_millis(timestamp)
+
+
+def _datetime_to_millis(timestamp: datetime) -> int:
+    # Scaling the float timestamp by 1000 can land just below the intended value
+    # and truncate a millisecond away, so add the milliseconds as integers.
+    return math.floor(timestamp.timestamp()) * 1000 + timestamp.microsecond // 1000
+
 
-        unique_csql["datasources"] = datasource_for_csql
-        unique_custom_sql.append(unique_csql)
-    return unique_custom_sql
+# Entities of a workbook often share the same createdAt/updatedAt values, so cache
+# the parsed result per timestamp string.
+@lru_cache(maxsize=8192)
+def _parse_timestamp_millis(timestamp: str) -> int:
+    # Tableau returns ISO-8601 timestamps such as 2021-12-17T19:51:52Z, which
+    # datetime.fromisoformat handles much faster than dateutil once the Z suffix
+    # is spelled out. fromisoformat is not available on Python 3.6.
+    try:
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        parsed = dp.parse(timestamp)
+    return _datetime_to_millis(parsed)
 
 
 def clean_query(query):
@@ -458,9 +483,14 @@ def clean_query(query):
     return query
 
 
-def query_metadata(server, main_query, connection_name, first, offset, qry_filter=""):
+def query_metadata(
+    server, main_query, connection_name, first, offset, qry_filter="", after=None
+):
+    # Prefer cursor based pagination when the server handed us a cursor, it avoids
+    # the server re-scanning all previous rows for every page.
+    position = f'after:"{after}"' if after else f"offset:{offset}"
     query = """{{
-        {connection_name} (first:{first}, offset:{offset}, filter:{{{filter}}})
+        {connection_name} (first:{first}, {position}, filter:{{{filter}}})
         {{
             nodes {main_query}
             pageInfo {{
@@ -472,7 +502,7 @@ def query_metadata(server, main_query, connection_name, first, offset, qry_filte
     }}""".format(
         connection_name=connection_name,
         first=first,
-        offset=offset,
+        position=position,
         filter=qry_filter,
         main_query=main_query,
     )
@@ -1,5 +1,5 @@
 import datahub.emitter.mcp_builder as builder
-from datahub.emitter.mce_builder import datahub_guid
+from datahub.emitter.mce_builder import datahub_guid, make_container_urn
 
 
 def test_guid_generator():
@@ -42,3 +42,32 @@ def test_guid_generators():
 
     guid = key.guid()
     assert guid == guid_datahub
+
+
+def test_add_entities_to_container():
+    key = builder.SchemaKey(
+        database="test", schema="Test", platform="mysql", instance="TestInstance"
+    )
+    container_urn = make_container_urn(key.guid())
+    entity_urns = [
+        "urn:li:chart:(tableau,chart1)",
+        "urn:li:chart:(tableau,chart2)",
+    ]
+
+    workunits = list(builder.add_entities_to_container(key, "chart", entity_urns))
+
+    assert len(workunits) == len(entity_urns)
+    for wu, entity_urn in zip(workunits, entity_urns):
+        assert wu.id == f"container-{container_urn}-to-{entity_urn}"
+        assert wu.metadata.entityType == "chart"
+        assert wu.metadata.entityUrn == entity_urn
+        assert wu.metadata.aspectName == "container"
+        assert wu.metadata.aspect.container == container_urn
+
+
+def test_add_entities_to_container_without_entities():
+    key = builder.SchemaKey(
+        database="test", schema="Test", platform="mysql", instance="TestInstance"
+    )
+
+    assert list(builder.add_entities_to_container(key, "chart", [])) == []
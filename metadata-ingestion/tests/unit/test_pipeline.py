@@ -178,6 +178,29 @@ class TestPipeline(object):
             else:
                 mock_commit.assert_not_called()
 
+    def test_pipeline_shares_only_a_digest_of_the_sink_config(self, tmp_path):
+        def create_pipeline(filename: str) -> Pipeline:
+            return Pipeline.create(
+                {
+                    "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                    "sink": {"type": "file", "config": {"filename": filename}},
+                    "run_id": "pipeline_test",
+                }
+            )
+
+        sink_path = str(tmp_path / "sink.json")
+        pipeline = create_pipeline(sink_path)
+
+        assert pipeline.ctx.sink_identity
+        assert sink_path not in pipeline.ctx.sink_identity
+        assert (
+            create_pipeline(sink_path).ctx.sink_identity == pipeline.ctx.sink_identity
+        )
+        assert (
+            create_pipeline(str(tmp_path / "other.json")).ctx.sink_identity
+            != pipeline.ctx.sink_identity
+        )
+
 
 class AddStatusRemovedTransformer(Transformer):
     @classmethod
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+from datahub.ingestion.source.tableau_common import (
+    get_field_values_in_sheet,
+    get_timestamp_millis,
+)
+
+
+def test_get_timestamp_millis_iso_string():
+    assert get_timestamp_millis("2021-12-17T19:51:52Z") == 1639770712000
+
+
+def test_get_timestamp_millis_iso_string_with_fraction_and_offset():
+    assert get_timestamp_millis("2021-12-17T19:51:52.123Z") == 1639770712123
+    assert get_timestamp_millis("2021-12-17T21:51:52+02:00") == 1639770712000
+
+
+def test_get_timestamp_millis_non_iso_string():
+    assert get_timestamp_millis("Dec 17 2021 19:51:52 UTC") == 1639770712000
+
+
+def test_get_timestamp_millis_datetime():
+    timestamp = datetime(2021, 12, 17, 19, 51, 52, tzinfo=timezone.utc)
+    assert get_timestamp_millis(timestamp) == 1639770712000
+
+
+def test_get_field_values_in_sheet_reads_remote_field():
+    field = {
+        "__typename": "DatasourceField",
+        "name": "Sales",
+        "remoteField": {"name": "Sales", "description": "Total sales"},
+    }
+    assert get_field_values_in_sheet(field, "name", "description", "formula") == (
+        "Sales",
+        "Total sales",
+        "",
+    )
+
+
+def test_get_field_values_in_sheet_without_remote_field():
+    field = {"__typename": "DatasourceField", "name": "Sales", "remoteField": None}
+    assert get_field_values_in_sheet(field, "name", "description") == ("", "")
+
+
+def test_get_timestamp_millis_keeps_exact_milliseconds():
+    # 1078657503.001 * 1000 is just below 1078657503001 as a float
+    assert get_timestamp_millis("2004-03-07T11:05:03.001Z") == 1078657503001
@@ -0,0 +1,240 @@
+import itertools
+from typing import Any, List, Optional, Tuple
+from unittest import mock
+
+import pytest
+
+from datahub.ingestion.api.committable import CommitPolicy
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.run.pipeline import Pipeline
+from datahub.ingestion.source.tableau import (
+    TableauConfig,
+    TableauEmittedCache,
+    TableauSource,
+)
+from datahub.metadata.schema_classes import SubTypesClass
+
+
+def _create_tableau_source(
+    ctx: Optional[PipelineContext] = None, **extra_config
+) -> TableauSource:
+    config = TableauConfig.parse_obj(
+        {
+            "connect_uri": "https://do-not-connect",
+            "username": "username",
+            "password": "password",
+            **extra_config,
+        }
+    )
+    with mock.patch("datahub.ingestion.source.tableau.Server"):
+        return TableauSource(ctx or PipelineContext(run_id="tableau-test"), config)
+
+
+def _fake_query_metadata(total_count: int) -> mock.Mock:
+    # Serves nodes 0..total_count-1, positioned by cursor when given one. The end
+    # cursor of a page is the index of the next node.
+    def query_metadata(
+        server, main_query, connection_name, first, offset, qry_filter="", after=None
+    ):
+        start = int(after) if after else offset
+        end = min(start + first, total_count)
+        return {
+            "data": {
+                connection_name: {
+                    "nodes": [{"id": str(i)} for i in range(start, end)],
+                    "pageInfo": {
+                        "hasNextPage": end < total_count,
+                        "endCursor": str(end) if first else None,
+                    },
+                    "totalCount": total_count,
+                }
+            }
+        }
+
+    return mock.Mock(side_effect=query_metadata)
+
+
+def _page_arguments(query_metadata: mock.Mock) -> List[Tuple[int, int, Any]]:
+    # (first, offset, after) of every query sent
+    return [
+        (call.args[3], call.args[4], call.args[6]) for call in query_metadata.mock_calls
+    ]
+
+
+def test_tableau_pages_serially_by_cursor():
+    source = _create_tableau_source(max_threads=1)
+    query_metadata = _fake_query_metadata(total_count=5)
+
+    with mock.patch("datahub.ingestion.source.tableau.query_metadata", query_metadata):
+        nodes = list(source.get_connection_nodes("{id}", "workbooksConnection", "", 2))
+
+    assert [node["id"] for node in nodes] == ["0", "1", "2", "3", "4"]
+    assert _page_arguments(query_metadata) == [
+        (0, 0, None),
+        (2, 0, None),
+        (2, 2, "2"),
+        (1, 4, "4"),
+    ]
+
+
+def test_tableau_pages_concurrently_by_offset():
+    source = _create_tableau_source(max_threads=2)
+    query_metadata = _fake_query_metadata(total_count=7)
+
+    with mock.patch("datahub.ingestion.source.tableau.query_metadata", query_metadata):
+        node_iterator = iter(
+            source.get_connection_nodes("{id}", "workbooksConnection", "", 2)
+        )
+        nodes = list(itertools.islice(node_iterator, 4))
+        # The next max_threads pages are only requested once these are consumed.
+        assert query_metadata.call_count == 3
+        nodes.extend(node_iterator)
+
+    assert [node["id"] for node in nodes] == ["0", "1", "2", "3", "4", "5", "6"]
+    page_arguments = _page_arguments(query_metadata)
+    assert page_arguments[0] == (0, 0, None)
+    # Pages of a batch are fetched concurrently, so only the set of pages is fixed.
+    assert sorted(page_arguments[1:]) == [
+        (1, 6, None),
+        (2, 0, None),
+        (2, 2, None),
+        (2, 4, None),
+    ]
+
+
+def test_tableau_skips_datasource_queries_without_ids():
+    source = _create_tableau_source()
+
+    assert list(source.emit_published_datasources()) == []
+    assert list(source.emit_custom_sql_datasources()) == []
+    source.server.metadata.query.assert_not_called()
+
+
+def _run_with_workunits(source, workunits):
+    with mock.patch.object(
+        source, "emit_workbooks", return_value=workunits
+    ), mock.patch.object(
+        source, "emit_published_datasources", return_value=[]
+    ), mock.patch.object(
+        source, "emit_custom_sql_datasources", return_value=[]
+    ):
+        return list(source.get_workunits())
+
+
+def test_tableau_skips_workunits_unchanged_since_previous_run(tmp_path):
+    cache_path = str(tmp_path / "tableau_cache")
+    urn = "urn:li:dataset:(urn:li:dataPlatform:tableau,id,PROD)"
+
+    source = _create_tableau_source(cache_path=cache_path)
+    workunit = source.get_metadata_change_proposal(
+        urn, aspect_name="subTypes", aspect=SubTypesClass(typeNames=["View"])
+    )
+    assert _run_with_workunits(source, [workunit]) == [workunit]
+    assert source.emitted_cache is not None
+    assert source.ctx.checkpointers["tableau-emitted-cache"] is source.emitted_cache
+    assert (
+        source.emitted_cache.commit_policy == CommitPolicy.ON_NO_ERRORS_AND_NO_WARNINGS
+    )
+    source.emitted_cache.commit()
+
+    source = _create_tableau_source(cache_path=cache_path)
+    unchanged = source.get_metadata_change_proposal(
+        urn, aspect_name="subTypes", aspect=SubTypesClass(typeNames=["View"])
+    )
+    changed = source.get_metadata_change_proposal(
+        urn, aspect_name="subTypes", aspect=SubTypesClass(typeNames=["Custom SQL"])
+    )
+    assert _run_with_workunits(source, [unchanged]) == []
+    assert source.report.workunits_produced == 0
+    assert source.report.workunits_skipped_unchanged == 1
+    assert _run_with_workunits(source, [changed]) == [changed]
+
+
+def test_tableau_emitted_cache_only_remembers_committed_runs(tmp_path):
+    cache_path = str(tmp_path / "tableau_cache")
+    workunit = _create_tableau_source().get_metadata_change_proposal(
+        "urn:li:dataset:(urn:li:dataPlatform:tableau,id,PROD)",
+        aspect_name="subTypes",
+        aspect=SubTypesClass(typeNames=["View"]),
+    )
+
+    cache = TableauEmittedCache(cache_path, "site|sink")
+    assert not cache.is_unchanged(workunit)
+    assert not TableauEmittedCache(cache_path, "site|sink").is_unchanged(workunit)
+
+    cache.commit()
+    assert TableauEmittedCache(cache_path, "site|sink").is_unchanged(workunit)
+    assert not TableauEmittedCache(cache_path, "site|other-sink").is_unchanged(workunit)
+
+
+def test_tableau_emitted_cache_does_not_skip_repeated_ids(tmp_path):
+    cache_path = str(tmp_path / "tableau_cache")
+    source = _create_tableau_source()
+    urn = "urn:li:dataset:(urn:li:dataPlatform:tableau,id,PROD)"
+    first = source.get_metadata_change_proposal(
+        urn, aspect_name="subTypes", aspect=SubTypesClass(typeNames=["View"])
+    )
+    second = source.get_metadata_change_proposal(
+        urn, aspect_name="subTypes", aspect=SubTypesClass(typeNames=["Custom SQL"])
+    )
+    assert first.id == second.id
+
+    cache = TableauEmittedCache(cache_path, "site|sink")
+    assert not cache.is_unchanged(first)
+    assert not cache.is_unchanged(second)
+    cache.commit()
+
+    # Skipping the unchanged first payload alone would leave it in the sink.
+    cache = TableauEmittedCache(cache_path, "site|sink")
+    assert not cache.is_unchanged(first)
+    assert not cache.is_unchanged(second)
+
+    cache = TableauEmittedCache(cache_path, "site|sink")
+    assert not cache.is_unchanged(first)
+    cache.commit()
+
+    # The last run produced the id once, so only a new second payload is emitted.
+    cache = TableauEmittedCache(cache_path, "site|sink")
+    assert cache.is_unchanged(first)
+    assert not cache.is_unchanged(second)
+
+
+@pytest.mark.parametrize("sink_warning", [False, True])
+def test_tableau_emitted_cache_is_not_committed_after_sink_warnings(
+    tmp_path, sink_warning
+):
+    cache_path = str(tmp_path / "tableau_cache")
+    workunit = _create_tableau_source().get_metadata_change_proposal(
+        "urn:li:dataset:(urn:li:dataPlatform:tableau,id,PROD)",
+        aspect_name="subTypes",
+        aspect=SubTypesClass(typeNames=["View"]),
+    )
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+            "sink": {"type": "console"},
+            "run_id": "tableau-test",
+        }
+    )
+    cache = TableauEmittedCache(cache_path, "site|sink")
+    pipeline.ctx.register_checkpointer(cache)
+    cache.is_unchanged(workunit)
+    if sink_warning:
+        # How datahub-rest reports a rejected MCP with treat_errors_as_warnings
+        pipeline.sink.get_report().report_warning({"error": "rejected"})
+
+    pipeline.process_commits()
+
+    assert cache.committed != sink_warning
+    assert (
+        TableauEmittedCache(cache_path, "site|sink").is_unchanged(workunit)
+        != sink_warning
+    )
+
+
+def test_tableau_dry_run_does_not_use_emitted_cache(tmp_path):
+    ctx = PipelineContext(run_id="tableau-test", dry_run=True)
+    source = _create_tableau_source(ctx, cache_path=str(tmp_path / "tableau_cache"))
+
+    assert source.emitted_cache is None
+    assert not ctx.checkpointers